@@ -19,37 +19,141 @@ Date: 2025
 License: MIT
 
 Dependencies:
-- Pillow (PIL): For image processing and PDF generation
+- Pillow (PIL): For decoding and re-compressing images that cannot be
+  embedded as-is (the PDF itself is written by this module)
 - tkinter: For GUI dialogs (included with Python)
+- PyTurboJPEG and NumPy (optional): Faster JPEG decoding via libjpeg-turbo
 
 Usage:
-    python jpeg_to_pdf_converter.py
+    python jpeg_to_pdf_converter.py [--dpi DPI]
 
 Requirements:
     pip install Pillow
+    pip install PyTurboJPEG numpy  # optional, requires the libturbojpeg library
 """
 
+import argparse
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from PIL import Image
+import io
+import logging
+import mmap
 import os
-from pathlib import Path
+import sys
+import tempfile
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 
+try:
+    # Optional libjpeg-turbo binding for SIMD-accelerated JPEG decoding,
+    # which returns NumPy arrays
+    import numpy as np
+    from turbojpeg import TurboJPEG, TJPF_GRAY, TJPF_RGB, TJSAMP_GRAY, TJSAMP_420
+    _turbo_jpeg = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    # PyTurboJPEG or the libturbojpeg shared library is not available,
+    # Pillow's bundled decoder is used instead
+    _turbo_jpeg = None
 
-def select_jpeg_files():
+logger = logging.getLogger("jpeg_to_pdf_converter")
+
+# Page layout resolution: one image pixel is 1/PDF_RESOLUTION inch
+PDF_RESOLUTION = 100.0
+
+# Reductions (1/n) that libjpeg can apply while decoding, within the IDCT
+DCT_SCALE_DENOMINATORS = (8, 4, 2)
+
+# JPEG quality used when images have to be compressed again
+JPEG_QUALITY = 85
+
+# Pixel rows copied and compressed at a time for Flate-compressed images
+DEFLATE_BAND_ROWS = 64
+
+# JPEG start-of-frame markers that PDF readers can decode through the
+# DCTDecode filter (baseline, extended sequential and progressive)
+DCT_SOF_MARKERS = (0xC0, 0xC1, 0xC2)
+
+# Start-of-frame markers of all JPEG coding processes (0xC4, 0xC8 and 0xCC
+# are DHT, JPG and DAC, which share the range but carry no frame header)
+JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+# PDF color spaces for the number of components in a JPEG frame
+PDF_COLOR_SPACES = {1: '/DeviceGray', 3: '/DeviceRGB', 4: '/DeviceCMYK'}
+
+# Pillow image modes matching the number of components in a JPEG frame
+JPEG_MODES = {1: 'L', 3: 'RGB', 4: 'CMYK'}
+
+# Pillow formats of JPEG files; files with an MPF segment (camera MPOs,
+# photos with a gain map) are reported as MPO
+JPEG_FORMATS = ('JPEG', 'MPO')
+
+# Correction applied to the pixel data for each EXIF orientation
+ORIENTATION_CORRECTIONS = {
+    2: "horizontal flip",
+    3: "180° rotation",
+    4: "vertical flip",
+    5: "transpose",
+    6: "270° rotation",
+    7: "transverse",
+    8: "90° rotation",
+}
+
+# Pillow transpose method correcting each EXIF orientation; these only
+# reorder rows and columns (Image.Transpose exists since Pillow 9.1, older
+# versions define the constants on the Image module)
+_Transpose = getattr(Image, 'Transpose', Image)
+ORIENTATION_TRANSPOSE_METHODS = {
+    2: _Transpose.FLIP_LEFT_RIGHT,
+    3: _Transpose.ROTATE_180,
+    4: _Transpose.FLIP_TOP_BOTTOM,
+    5: _Transpose.TRANSPOSE,
+    6: _Transpose.ROTATE_270,
+    7: _Transpose.TRANSVERSE,
+    8: _Transpose.ROTATE_90,
+}
+
+# Strided NumPy views correcting each EXIF orientation of a pixel array
+# (np.rot90 turns counter-clockwise); no pixel data is copied
+PIXEL_ARRAY_ORIENTATIONS = {
+    2: lambda pixels: np.fliplr(pixels),
+    3: lambda pixels: np.rot90(pixels, 2),
+    4: lambda pixels: np.flipud(pixels),
+    5: lambda pixels: np.swapaxes(pixels, 0, 1),
+    6: lambda pixels: np.rot90(pixels, -1),
+    7: lambda pixels: np.swapaxes(np.rot90(pixels, 2), 0, 1),
+    8: lambda pixels: np.rot90(pixels, 1),
+}
+
+# Image placement matrix (a b c d e f) for each EXIF orientation, given the
+# stored image width and height in points. Drawing the image through this
+# matrix shows it upright without touching the compressed data.
+ORIENTATION_MATRICES = {
+    1: lambda w, h: (w, 0, 0, h, 0, 0),
+    2: lambda w, h: (-w, 0, 0, h, w, 0),    # Mirrored horizontally
+    3: lambda w, h: (-w, 0, 0, -h, w, h),   # Rotated 180°
+    4: lambda w, h: (w, 0, 0, -h, 0, h),    # Mirrored vertically
+    5: lambda w, h: (0, -w, -h, 0, h, w),   # Mirrored along the main diagonal
+    6: lambda w, h: (0, -w, h, 0, 0, w),    # Rotated 90° CW
+    7: lambda w, h: (0, w, h, 0, 0, 0),     # Mirrored along the anti-diagonal
+    8: lambda w, h: (0, w, -h, 0, h, 0),    # Rotated 90° CCW
+}
+
+
+def select_jpeg_files(parent):
     """
     Display a file selection dialog for choosing JPEG files.
     
     Opens a native file dialog allowing multiple file selection with
     appropriate file type filters for JPEG images.
     
+    Args:
+        parent (tk.Tk): Hidden root window owning the dialog
+    
     Returns:
         tuple: Tuple of selected file paths, empty if cancelled
     """
-    # Create root window and hide it immediately
-    root = tk.Tk()
-    root.withdraw()  # Hide the main window to show only dialog
-    
     # Define file type filters for the dialog
     file_types = [
         ("JPEG files", "*.jpg *.jpeg *.JPG *.JPEG"),
@@ -58,190 +162,761 @@ def select_jpeg_files():
     
     # Open multiple file selection dialog
     files = filedialog.askopenfilenames(
+        parent=parent,
         title="Select JPEG files to convert",
         filetypes=file_types
     )
     
-    # Clean up the root window
-    root.destroy()
     return files
 
 
-def select_output_path():
+def select_output_path(parent):
     """
     Display a save dialog for choosing the output PDF location.
     
     Opens a native save dialog with PDF file type filter and
     automatic extension handling.
     
+    Args:
+        parent (tk.Tk): Hidden root window owning the dialog
+    
     Returns:
         str: Selected output file path, empty string if cancelled
     """
-    root = tk.Tk()
-    root.withdraw()  # Hide the main window
-    
     # Open save file dialog with PDF filter
     output_file = filedialog.asksaveasfilename(
+        parent=parent,
         title="Save PDF as",
         defaultextension=".pdf",
         filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")]
     )
     
-    root.destroy()
     return output_file
 
 
-def apply_exif_orientation(image, file_path):
+def map_file(file_path):
+    """
+    Memory-map a file for reading.
+    
+    The file contents are read straight from the operating system's page
+    cache instead of being copied through Python's buffered I/O, and the
+    pages are shared between the worker processes and the parent process.
+    
+    Args:
+        file_path (str): Path to the file to map
+    
+    Returns:
+        mmap.mmap: Read-only mapping of the whole file
+    
+    Raises:
+        OSError: If the file cannot be opened
+        ValueError: If the file is empty
+    """
+    with open(file_path, 'rb') as f:
+        # The mapping keeps its own handle, so the file can be closed
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    # Files are read front to back, let the OS read ahead aggressively
+    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+        mapping.madvise(mmap.MADV_SEQUENTIAL)
+    return mapping
+
+
+def dct_scale_denominator(dpi):
+    """
+    Pick how much to reduce JPEG images while decoding them.
+    
+    Pages are laid out at PDF_RESOLUTION, so an image decoded at 1/n of its
+    size ends up with PDF_RESOLUTION / n pixels per inch on the page. The
+    strongest reduction that still meets the requested resolution is used.
+    
+    Args:
+        dpi (float): Requested image resolution, None to keep full size
+    
+    Returns:
+        int: Denominator n of the 1/n reduction, 1 for no reduction
+    """
+    if dpi:
+        for denominator in DCT_SCALE_DENOMINATORS:
+            if PDF_RESOLUTION / denominator >= dpi:
+                return denominator
+    return 1
+
+
+def decode_jpeg(data, components=3, scale=1, log=logger.info):
+    """
+    Decode a JPEG bitstream to gray or RGB pixel data with libjpeg-turbo.
+    
+    Uses libjpeg-turbo (via PyTurboJPEG) when it is installed. Its
+    SIMD-accelerated Huffman and IDCT routines decode straight into the
+    output pixel format, with chroma upsampling and color conversion
+    fused into the same pass. The pixels stay in the NumPy array returned
+    by the decoder, so they can be reoriented and compressed without
+    copying them into Pillow.
+    
+    Args:
+        data (bytes or mmap.mmap): Contents of the JPEG file
+        components (int): Number of color components in the JPEG frame;
+                          single-component images are decoded as gray
+        scale (int): Denominator of the 1/n reduction applied by the IDCT
+        log (callable): Function receiving the progress messages
+    
+    Returns:
+        numpy.ndarray: Height x width x 1 (gray) or 3 (RGB) array of pixel
+                       values, or None if libjpeg-turbo is not available or
+                       rejects the file (the image is then left to Pillow's
+                       own decoder)
+    """
+    if _turbo_jpeg is None:
+        return None
+    
+    pixel_format = TJPF_GRAY if components == 1 else TJPF_RGB
+    scaling_factor = (1, scale) if scale > 1 else None
+    try:
+        return _turbo_jpeg.decode(data, pixel_format=pixel_format, scaling_factor=scaling_factor)
+    except (OSError, ValueError) as e:
+        log(f"  → libjpeg-turbo decode failed ({str(e)}), using Pillow")
+        return None
+
+
+def encode_jpeg(image):
+    """
+    Compress an image or pixel array as JPEG.
+    
+    Pixel arrays decoded by libjpeg-turbo are encoded by libjpeg-turbo as
+    well, Pillow images by Pillow. CMYK images are written by Pillow with
+    an Adobe marker and inverted values, like Adobe applications do.
+    
+    Args:
+        image (PIL.Image or numpy.ndarray): The image or pixel array to compress
+    
+    Returns:
+        bytes: The JPEG file data
+    """
+    if isinstance(image, Image.Image):
+        buffer = io.BytesIO()
+        image.save(buffer, format='JPEG', quality=JPEG_QUALITY)
+        return buffer.getvalue()
+    
+    gray = image.shape[2] == 1
+    return _turbo_jpeg.encode(
+        np.ascontiguousarray(image),
+        quality=JPEG_QUALITY,
+        pixel_format=TJPF_GRAY if gray else TJPF_RGB,
+        jpeg_subsample=TJSAMP_GRAY if gray else TJSAMP_420
+    )
+
+
+def deflate_pixels(image):
+    """
+    Compress the pixel data of an image with zlib.
+    
+    The pixels are copied out and compressed one band of rows at a time,
+    so only a small slice of the uncompressed data exists next to the
+    image itself, instead of a second full-size copy.
+    
+    Args:
+        image (PIL.Image): The image to compress
+    
+    Returns:
+        bytes: The zlib stream of the pixel rows, top to bottom
+    """
+    compressor = zlib.compressobj()
+    width, height = image.size
+    chunks = [
+        compressor.compress(image.crop((0, top, width, min(top + DEFLATE_BAND_ROWS, height))).tobytes())
+        for top in range(0, height, DEFLATE_BAND_ROWS)
+    ]
+    chunks.append(compressor.flush())
+    return b''.join(chunks)
+
+
+def apply_exif_orientation(image, orientation, log=logger.info):
     """
     Apply EXIF orientation correction to an image.
     
-    Reads EXIF metadata from JPEG files and applies the appropriate rotation
+    Applies the rotation or flip described by the EXIF orientation value
     to ensure the image displays with correct orientation, matching how it
-    appears in standard image viewers.
+    appears in standard image viewers. Image.transpose reorders rows and
+    columns directly instead of resampling the image.
+    
+    Pixel arrays decoded by libjpeg-turbo are rotated or flipped through a
+    strided NumPy view instead, which does not copy any pixel data.
     
     Args:
-        image (PIL.Image): The PIL Image object to process
-        file_path (str): Path to the image file (for logging purposes)
+        image (PIL.Image or numpy.ndarray): The image or pixel array to process
+        orientation (int): EXIF orientation value, None if not available
+        log (callable): Function receiving the progress messages
     
     Returns:
-        PIL.Image: The image with correct orientation applied
+        PIL.Image or numpy.ndarray: The image with correct orientation applied
     
     Note:
         EXIF Orientation values:
         1 = Normal (no rotation)
+        2 = Mirrored horizontally (horizontal flip)
         3 = Upside down (180° rotation)
+        4 = Mirrored vertically (vertical flip)
+        5 = Mirrored along the main diagonal (transpose)
         6 = Rotated 90° CW (needs 270° CCW correction)
+        7 = Mirrored along the anti-diagonal (transverse)
         8 = Rotated 90° CCW (needs 90° CCW correction)
     """
+    if orientation is None:
+        # EXIF data not available, corrupted, or unreadable
+        log(f"  → No EXIF orientation data available")
+    elif orientation == 1:
+        # Normal orientation - no rotation needed
+        log(f"  → No rotation needed (EXIF orientation: {orientation})")
+    elif orientation in ORIENTATION_CORRECTIONS:
+        if isinstance(image, Image.Image):
+            image = image.transpose(ORIENTATION_TRANSPOSE_METHODS[orientation])
+        else:
+            image = PIXEL_ARRAY_ORIENTATIONS[orientation](image)
+        log(f"  → Applied {ORIENTATION_CORRECTIONS[orientation]} (EXIF orientation: {orientation})")
+    
+    return image
+
+
+def _jpeg_segments(data):
+    """
+    Iterate over the marker segments of a JPEG bitstream.
+    
+    Stops at the start of scan (SOS) marker, where the header ends and the
+    entropy-coded image data begins.
+    
+    Args:
+        data (bytes): Contents of a JPEG file, at least its header
+    
+    Yields:
+        tuple: (marker, payload) of each segment, payload excluding the
+               marker and length fields
+    """
+    if data[:2] != b'\xff\xd8':
+        return
+    
+    pos = 2
+    while pos + 4 <= len(data):
+        if data[pos] != 0xFF:
+            return
+        marker = data[pos + 1]
+        
+        if marker == 0xFF:
+            # Fill byte preceding the actual marker
+            pos += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD7:
+            # Standalone markers without a length field
+            pos += 2
+            continue
+        if marker == 0xDA:
+            return
+        
+        # Segment: marker (2 bytes), then its length field and payload
+        end = pos + 2 + int.from_bytes(data[pos + 2:pos + 4], 'big')
+        yield marker, data[pos + 4:end]
+        pos = end
+
+
+def read_jpeg_header(data):
+    """
+    Read the frame header of a JPEG bitstream without decoding it.
+    
+    Walks the marker segments up to the first start-of-frame (SOFn)
+    marker and reads the image properties stored there.
+    
+    Args:
+        data (bytes): Complete contents of a JPEG file
+    
+    Returns:
+        tuple: (sof_marker, width, height, components, bits_per_component),
+               or None if the data is not a readable JPEG stream
+    """
+    for marker, payload in _jpeg_segments(data):
+        if marker in JPEG_SOF_MARKERS:
+            if len(payload) < 6:
+                return None
+            bits = payload[0]
+            height = int.from_bytes(payload[1:3], 'big')
+            width = int.from_bytes(payload[3:5], 'big')
+            components = payload[5]
+            return marker, width, height, components, bits
+    
+    return None
+
+
+def has_adobe_marker(data):
+    """
+    Check whether a JPEG file carries an Adobe APP14 segment.
+    
+    CMYK JPEGs with this segment store inverted color values, which must
+    be flipped back when the data is embedded as-is.
+    
+    Args:
+        data (bytes): Contents of a JPEG file, at least its header
+    
+    Returns:
+        bool: True if an Adobe segment is present
+    """
+    return any(
+        marker == 0xEE and payload[:5] == b'Adobe'
+        for marker, payload in _jpeg_segments(data)
+    )
+
+
+def read_exif_orientation(data):
+    """
+    Read the EXIF orientation of a JPEG file straight from its APP1 segment.
+    
+    Only the first image file directory (IFD0) of the EXIF block is scanned
+    for the orientation tag, instead of having Pillow parse the complete
+    EXIF tree.
+    
+    Args:
+        data (bytes): Contents of a JPEG file, at least its header
+    
+    Returns:
+        int: EXIF orientation value, or None if the file has none
+    """
+    for marker, payload in _jpeg_segments(data):
+        if marker != 0xE1 or payload[:6] != b'Exif\x00\x00':
+            continue
+        
+        # TIFF header: byte order, magic number 42 and offset of IFD0
+        tiff = payload[6:]
+        if tiff[:4] == b'II*\x00':
+            byteorder = 'little'
+        elif tiff[:4] == b'MM\x00*':
+            byteorder = 'big'
+        else:
+            return None
+        ifd = int.from_bytes(tiff[4:8], byteorder)
+        entry_count = int.from_bytes(tiff[ifd:ifd + 2], byteorder)
+        
+        # IFD entries: tag (2 bytes), type (2), count (4), value (4)
+        for entry in range(ifd + 2, ifd + 2 + 12 * entry_count, 12):
+            if entry + 12 > len(tiff):
+                return None
+            if int.from_bytes(tiff[entry:entry + 2], byteorder) == 0x0112:
+                value_type = int.from_bytes(tiff[entry + 2:entry + 4], byteorder)
+                value_size = 4 if value_type == 4 else 2  # LONG or SHORT
+                return int.from_bytes(tiff[entry + 8:entry + 8 + value_size], byteorder)
+        return None
+    
+    return None
+
+
+def _pdf_number(value):
+    """Format a number for a PDF content stream (no exponent notation)."""
+    return f"{value:.4f}".rstrip('0').rstrip('.') or '0'
+
+
+class PdfWriter:
+    """
+    Minimal PDF writer producing one page per embedded image.
+    
+    Image data is written as-is, so original JPEG bitstreams can be wrapped
+    in a DCTDecode stream without being decoded and re-compressed. Page and
+    image objects are written to the file as they are added; the page tree,
+    catalog and cross-reference table follow when the writer is closed.
+    Pages laying out their image the same way (e.g. a burst of photos from
+    one camera) reference a single shared content stream.
+    
+    Args:
+        file: Binary file object the PDF is written to
+        resolution (float): Page layout resolution in pixels per inch
+    """
+    
+    def __init__(self, file, resolution=PDF_RESOLUTION):
+        self.file = file
+        self.scale = 72.0 / resolution  # Points per image pixel
+        self.offsets = {}
+        self.page_ids = []
+        self.content_ids = {}  # Content stream object for each page layout
+        
+        # Object 1 is the page tree and object 2 the catalog, both written on close
+        self.next_id = 3
+        self.file.write(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+    
+    def _write_object(self, obj_id, body, stream=None):
+        """Write an indirect object, with an optional stream payload."""
+        self.offsets[obj_id] = self.file.tell()
+        self.file.write(f"{obj_id} 0 obj\n".encode('ascii'))
+        if stream is None:
+            self.file.write(body.encode('ascii') + b'\nendobj\n')
+        else:
+            self.file.write(body.encode('ascii') + b'\nstream\n')
+            self.file.write(stream)
+            self.file.write(b'\nendstream\nendobj\n')
+    
+    def _new_id(self):
+        """Allocate the next free object number."""
+        obj_id = self.next_id
+        self.next_id += 1
+        return obj_id
+    
+    def add_image_page(self, data, size, components, pdf_filter, orientation=1,
+                       inverted=False, layout_size=None):
+        """
+        Add a page showing a single image.
+        
+        Args:
+            data (bytes or mmap.mmap): Compressed image data
+            size (tuple): Stored (width, height) of the image in pixels
+            components (int): Number of color components (1, 3 or 4)
+            pdf_filter (str): PDF filter decoding the data ('DCTDecode' or 'FlateDecode')
+            orientation (int): EXIF orientation to display the image with
+            inverted (bool): Whether the color values are stored inverted,
+                             as in CMYK JPEGs written by Adobe applications
+            layout_size (tuple): (width, height) in pixels at the page layout
+                                 resolution, if the image is stored reduced
+        """
+        width, height = size
+        layout_width, layout_height = layout_size or size
+        w, h = layout_width * self.scale, layout_height * self.scale
+        matrix = ORIENTATION_MATRICES.get(orientation, ORIENTATION_MATRICES[1])(w, h)
+        page_size = (h, w) if orientation in (5, 6, 7, 8) else (w, h)
+        
+        decode = f"/Decode [{' '.join(['1 0'] * components)}] " if inverted else ""
+        
+        image_id = self._new_id()
+        self._write_object(
+            image_id,
+            f"<< /Type /XObject /Subtype /Image /Width {width} /Height {height} "
+            f"/ColorSpace {PDF_COLOR_SPACES[components]} /BitsPerComponent 8 {decode}"
+            f"/Filter /{pdf_filter} /Length {len(data)} >>",
+            data
+        )
+        
+        # Pages with the same size and orientation share one content stream
+        content = f"q {' '.join(map(_pdf_number, matrix))} cm /Im0 Do Q".encode('ascii')
+        content_id = self.content_ids.get(content)
+        if content_id is None:
+            content_id = self.content_ids[content] = self._new_id()
+            self._write_object(content_id, f"<< /Length {len(content)} >>", content)
+        
+        page_id = self._new_id()
+        self._write_object(
+            page_id,
+            f"<< /Type /Page /Parent 1 0 R "
+            f"/MediaBox [0 0 {_pdf_number(page_size[0])} {_pdf_number(page_size[1])}] "
+            f"/Resources << /XObject << /Im0 {image_id} 0 R >> >> "
+            f"/Contents {content_id} 0 R >>"
+        )
+        self.page_ids.append(page_id)
+    
+    def close(self):
+        """Write the page tree, catalog and cross-reference table."""
+        kids = ' '.join(f"{page_id} 0 R" for page_id in self.page_ids)
+        self._write_object(1, f"<< /Type /Pages /Kids [{kids}] /Count {len(self.page_ids)} >>")
+        self._write_object(2, "<< /Type /Catalog /Pages 1 0 R >>")
+        
+        xref_offset = self.file.tell()
+        xref = [f"xref\n0 {self.next_id}\n", "0000000000 65535 f \n"]
+        xref.extend(f"{self.offsets[obj_id]:010d} 00000 n \n" for obj_id in range(1, self.next_id))
+        xref.append(f"trailer\n<< /Size {self.next_id} /Root 2 0 R >>\n")
+        xref.append(f"startxref\n{xref_offset}\n%%EOF\n")
+        self.file.write(''.join(xref).encode('ascii'))
+
+
+def _load_one(file_path, dpi=None):
+    """
+    Load a single JPEG file in a worker process.
+    
+    Progress messages are collected rather than logged, so the parent
+    process can output them in order, all lines of an image at once.
+    
+    Args:
+        file_path (str): Path to the JPEG file to load
+        dpi (float): Requested image resolution, None to keep full size
+    
+    Returns:
+        tuple: (messages, image) with the list of progress messages and the
+               result of load_image()
+    """
+    messages = []
+    return messages, load_image(file_path, dpi, messages.append)
+
+
+def load_image(file_path, dpi=None, log=logger.info):
+    """
+    Load a single JPEG file as image data ready to embed in the PDF.
+    
+    Baseline and progressive JPEGs are passed through untouched: their
+    original bitstream is embedded and the EXIF orientation is applied when
+    the page is laid out, so they are never opened by Pillow. Only their
+    header is read here; the caller copies the file into the PDF itself,
+    so the data does not have to be sent back through the process pool.
+    Other images are decoded and orientation-corrected. JPEGs are then
+    compressed as JPEG again, images in other formats losslessly, converted
+    to RGB mode only if PDF has no matching color space.
+    
+    When a resolution is requested, JPEGs that exceed it are instead reduced
+    while decoding (in the DCT domain) before they are compressed again.
+    
+    Args:
+        file_path (str): Path to the JPEG file to load
+        dpi (float): Requested image resolution, None to keep full size
+        log (callable): Function receiving the progress messages
+    
+    Returns:
+        tuple: (data, size, components, pdf_filter, orientation, inverted,
+               layout_size) describing the image to embed, data being None
+               if the file is to be embedded as-is; or None if the file
+               could not be opened
+    """
     try:
-        # Attempt to read EXIF data from the image
-        exif = image._getexif()
+        data = map_file(file_path)
+    except (OSError, ValueError) as e:
+        log(f"  ❌ Failed to open image: {str(e)}")
+        return None
+    
+    with data:
+        header = read_jpeg_header(data)
+        orientation = read_exif_orientation(data)
+        scale = dct_scale_denominator(dpi)
         
-        if exif is not None:
-            # EXIF orientation tag number is 274
-            orientation = exif.get(274)
-            
-            if orientation:
-                # Apply rotation based on EXIF orientation value
-                if orientation == 3:
-                    # Image is upside down - rotate 180°
-                    image = image.rotate(180, expand=True)
-                    print(f"  → Applied 180° rotation (EXIF orientation: {orientation})")
-                elif orientation == 6:
-                    # Image is rotated 90° clockwise - rotate 270° to correct
-                    image = image.rotate(270, expand=True)
-                    print(f"  → Applied 270° rotation (EXIF orientation: {orientation})")
-                elif orientation == 8:
-                    # Image is rotated 90° counter-clockwise - rotate 90° to correct
-                    image = image.rotate(90, expand=True)
-                    print(f"  → Applied 90° rotation (EXIF orientation: {orientation})")
-                elif orientation == 1:
-                    # Normal orientation - no rotation needed
-                    print(f"  → No rotation needed (EXIF orientation: {orientation})")
-                else:
-                    # Uncommon orientation values (2, 4, 5, 7) involve flipping
-                    print(f"  → Unsupported EXIF orientation: {orientation} (no rotation applied)")
+        # Embed the original JPEG data whenever PDF readers can decode it
+        if header is not None and scale == 1:
+            sof_marker, width, height, components, bits = header
+            if sof_marker in DCT_SOF_MARKERS and bits == 8 and components in PDF_COLOR_SPACES:
+                log(f"  → Opened successfully ({width}x{height} pixels, {JPEG_MODES[components]} mode)")
+                log(f"  → Embedding original JPEG data (EXIF orientation: {orientation or 1})")
+                log(f"  ✅ Successfully processed")
+                inverted = components == 4 and has_adobe_marker(data)
+                return None, (width, height), components, 'DCTDecode', orientation, inverted, None
+        
+        # Open the image file
+        try:
+            img = Image.open(file_path)
+            log(f"  → Opened successfully ({img.size[0]}x{img.size[1]} pixels, {img.mode} mode)")
+        except Exception as e:
+            log(f"  ❌ Failed to open image: {str(e)}")
+            return None
+        
+        if img.format not in JPEG_FORMATS:
+            # Other formats (e.g. PNG or TIFF) keep their EXIF data elsewhere
+            orientation = img.getexif().get(274)
+        
+        # Decode pixel data, using libjpeg-turbo when available
+        original_size = img.size
+        lossy_source = img.format in JPEG_FORMATS
+        if lossy_source:
+            pixels = decode_jpeg(data, header[3] if header is not None else 3, scale, log)
+        else:
+            pixels = None
+        if pixels is not None:
+            img.close()
+            img = pixels
+        elif lossy_source and scale > 1:
+            # Let libjpeg reduce the image within the IDCT while decoding
+            img.draft(img.mode, (max(1, img.size[0] // scale), max(1, img.size[1] // scale)))
+        
+        decoded_width = img.size[0] if isinstance(img, Image.Image) else img.shape[1]
+        if decoded_width < original_size[0]:
+            resolution = PDF_RESOLUTION * decoded_width / original_size[0]
+            log(f"  → Reduced to {resolution:.0f} DPI while decoding")
+        
+        # Apply EXIF orientation correction
+        img = apply_exif_orientation(img, orientation, log)
+        if orientation in (5, 6, 7, 8):
+            original_size = original_size[::-1]
+        
+        if isinstance(img, Image.Image):
+            # Gray, RGB and CMYK pixels are stored in the PDF as they are,
+            # other color modes are converted to RGB. JPEG files never need
+            # this: libjpeg already converts YCbCr/YCCK to RGB/CMYK while
+            # decoding, so only other formats (e.g. palette PNG) end up here
+            if img.mode not in JPEG_MODES.values():
+                original_mode = img.mode
+                img = img.convert('RGB')
+                log(f"  → Converted from {original_mode} to RGB mode")
+            else:
+                log(f"  → Keeping {img.mode} mode")
+            size, components = img.size, len(img.getbands())
+        else:
+            height, width, components = img.shape
+            size = (width, height)
+            log(f"  → Decoded to {JPEG_MODES[components]} by libjpeg-turbo")
+        
+        if lossy_source:
+            # JPEGs are stored as JPEG again: Flate-compressed pixels would
+            # take several times the space without preserving any more detail
+            data, pdf_filter, inverted = encode_jpeg(img), 'DCTDecode', components == 4
+        else:
+            # Images from lossless formats (e.g. PNG) are kept lossless
+            data, pdf_filter, inverted = deflate_pixels(img), 'FlateDecode', False
+        
+        log(f"  ✅ Successfully processed")
+        
+        # The page keeps the size of the full image; libjpeg rounds reduced
+        # dimensions up, so they cannot be scaled back by a single factor
+        return data, size, components, pdf_filter, 1, inverted, original_size
+
+
+def _load_images(jpeg_files, dpi=None):
+    """
+    Load JPEG files in parallel worker processes, yielding results in order.
     
-    except (AttributeError, KeyError, TypeError) as e:
-        # EXIF data not available, corrupted, or unreadable
-        print(f"  → No EXIF orientation data available")
+    At most a few images per CPU core are in flight at any time, so memory
+    use stays bounded no matter how many files are selected: each result
+    can be written out and released before the later files are loaded.
     
-    return image
+    Args:
+        jpeg_files (tuple): Collection of JPEG file paths to load
+        dpi (float): Requested image resolution, None to keep full size
+    
+    Yields:
+        tuple: The (messages, image) result of _load_one() for each file,
+               in input order
+    """
+    max_pending = 2 * (os.cpu_count() or 1)
+    pending = deque()
+    
+    with ProcessPoolExecutor() as executor:
+        for file_path in jpeg_files:
+            pending.append(executor.submit(_load_one, file_path, dpi))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        
+        while pending:
+            yield pending.popleft().result()
 
 
-def convert_jpegs_to_pdf(jpeg_files, output_path):
+def convert_jpegs_to_pdf(jpeg_files, output_path, dpi=None):
     """
     Convert a collection of JPEG files into a single multi-page PDF.
     
-    Processes each JPEG file by:
-    1. Opening the image
-    2. Applying EXIF orientation correction
-    3. Converting to RGB color mode (required for PDF)
-    4. Adding to the PDF compilation
+    Processes each JPEG file in parallel worker processes. JPEG data that
+    PDF readers can decode is embedded as-is, with the EXIF orientation
+    applied through the page layout; other images are:
+    1. Opened and decoded
+    2. Corrected for EXIF orientation
+    3. Converted to RGB color mode, unless already gray, RGB or CMYK
+    
+    Each image is written to the PDF as soon as it is loaded, one page
+    each and in the order they were given, so only a handful of images
+    are held in memory at once.
+    
+    If a resolution is given, JPEGs are reduced by 1/2, 1/4 or 1/8 while
+    decoding, as far as possible without falling below it; the page size
+    stays the same.
     
     Args:
         jpeg_files (tuple): Collection of JPEG file paths to convert
         output_path (str): Destination path for the output PDF file
+        dpi (float): Requested image resolution, None to keep full size
     
     Returns:
         bool: True if conversion successful, False otherwise
     """
     # Validate input
     if not jpeg_files:
-        print("❌ No files selected for conversion.")
+        logger.error("❌ No files selected for conversion.")
         return False
     
     if not output_path:
-        print("❌ No output path specified.")
+        logger.error("❌ No output path specified.")
         return False
     
+    temp_path = None
+    
     try:
-        print(f"\n📁 Processing {len(jpeg_files)} image(s)...")
+        logger.info(f"\n📁 Processing {len(jpeg_files)} image(s)...")
         
-        # Collection to store processed images
-        processed_images = []
+        # The PDF is written to a new temporary file next to the output file
+        # and only moved into place once complete, so a failed conversion
+        # leaves no truncated PDF behind and no existing file is overwritten
+        fd, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(output_path) or '.',
+            prefix=os.path.basename(output_path) + '.',
+            suffix='.part'
+        )
         
-        # Process each JPEG file
-        for i, file_path in enumerate(jpeg_files, 1):
-            print(f"\n[{i}/{len(jpeg_files)}] Processing: {os.path.basename(file_path)}")
-            
-            # Open the image file
-            try:
-                img = Image.open(file_path)
-                print(f"  → Opened successfully ({img.size[0]}x{img.size[1]} pixels, {img.mode} mode)")
-            except Exception as e:
-                print(f"  ❌ Failed to open image: {str(e)}")
-                continue
-            
-            # Apply EXIF orientation correction
-            img = apply_exif_orientation(img, file_path)
-            
-            # Convert to RGB color mode if necessary
-            # PDF format requires RGB mode for color images
-            if img.mode != 'RGB':
-                original_mode = img.mode
-                img = img.convert('RGB')
-                print(f"  → Converted from {original_mode} to RGB mode")
-            else:
-                print(f"  → Already in RGB mode")
+        # mkstemp() creates the file readable by the owner only; give the
+        # PDF the permissions a newly created file would have
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(temp_path, 0o666 & ~umask)
+        
+        # Write each page as soon as its image is loaded
+        with os.fdopen(fd, 'wb') as f:
+            writer = PdfWriter(f, resolution=PDF_RESOLUTION)
+            results = zip(jpeg_files, _load_images(jpeg_files, dpi))
+            for i, (file_path, (messages, result)) in enumerate(results, 1):
+                logger.info("\n".join([
+                    f"\n[{i}/{len(jpeg_files)}] Processing: {os.path.basename(file_path)}",
+                    *messages
+                ]))
+                if result is None:
+                    continue
+                data, *image = result
+                if data is None:
+                    # Embedded as-is: copy the file straight from the page cache
+                    with map_file(file_path) as data:
+                        writer.add_image_page(data, *image)
+                else:
+                    writer.add_image_page(data, *image)
+                # Drop this page's data before waiting for the next result
+                del data, result
             
-            # Add processed image to collection
-            processed_images.append(img)
-            print(f"  ✅ Successfully processed")
+            if writer.page_ids:
+                writer.close()
         
         # Check if we have any successfully processed images
-        if not processed_images:
-            print("\n❌ No images were successfully processed.")
+        if not writer.page_ids:
+            os.remove(temp_path)
+            logger.error("\n❌ No images were successfully processed.")
             return False
         
-        # Generate the PDF file
-        print(f"\n📄 Creating PDF with {len(processed_images)} page(s)...")
-        
-        # Save as multi-page PDF
-        # First image becomes the base, additional images are appended as pages
-        processed_images[0].save(
-            output_path,
-            save_all=True,  # Enable multi-page PDF
-            append_images=processed_images[1:] if len(processed_images) > 1 else [],
-            format='PDF',
-            resolution=100.0  # Set PDF resolution (DPI)
-        )
+        os.replace(temp_path, output_path)
         
-        print(f"✅ PDF created successfully!")
-        print(f"📍 Output location: {output_path}")
-        print(f"📊 File size: {os.path.getsize(output_path) / (1024*1024):.1f} MB")
+        logger.info(f"\n📄 Created PDF with {len(writer.page_ids)} page(s)")
+        logger.info(f"✅ PDF created successfully!")
+        logger.info(f"📍 Output location: {output_path}")
+        logger.info(f"📊 File size: {os.path.getsize(output_path) / (1024*1024):.1f} MB")
         
         return True
         
     except Exception as e:
         error_msg = f"Failed to create PDF: {str(e)}"
-        print(f"❌ {error_msg}")
+        logger.error(f"❌ {error_msg}")
+        
+        # Remove the incomplete PDF
+        if temp_path is not None:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
         
         # Show error dialog to user
         messagebox.showerror("Conversion Error", error_msg)
         return False
 
 
+def parse_arguments():
+    """
+    Parse the command line options.
+    
+    Returns:
+        argparse.Namespace: The parsed options
+    """
+    parser = argparse.ArgumentParser(
+        description="Convert multiple JPEG images into a single PDF document."
+    )
+    parser.add_argument(
+        '--dpi',
+        type=float,
+        help=f"Target image resolution in the PDF (pages are laid out at "
+             f"{PDF_RESOLUTION:.0f} DPI); larger JPEGs are reduced while decoding"
+    )
+    
+    args = parser.parse_args()
+    if args.dpi is not None and args.dpi <= 0:
+        parser.error("--dpi must be a positive number")
+    return args
+
+
 def main():
     """
     Main application entry point.
@@ -253,45 +928,61 @@ def main():
     4. Convert images to PDF
     5. Display success/failure message
     """
+    args = parse_arguments()
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    
     # Display application header
-    print("=" * 50)
-    print("🖼️  JPEG to PDF Converter")
-    print("=" * 50)
-    print("Image to PDF conversion tool")
-    print("Supports EXIF orientation correction")
-    print()
+    logger.info("=" * 50)
+    logger.info("🖼️  JPEG to PDF Converter")
+    logger.info("=" * 50)
+    logger.info("Image to PDF conversion tool")
+    logger.info("Supports EXIF orientation correction")
+    if args.dpi:
+        logger.info(f"Image resolution: {args.dpi:g} DPI")
+    logger.info("")
+    
+    # One hidden root window for all dialogs; starting Tcl/Tk is slow, so it
+    # is created once rather than for each dialog
+    root = tk.Tk()
+    root.withdraw()
     
     # Step 1: Select input JPEG files
-    print("📂 Step 1: Select JPEG files to convert...")
-    jpeg_files = select_jpeg_files()
+    logger.info("📂 Step 1: Select JPEG files to convert...")
+    jpeg_files = select_jpeg_files(root)
     
     # Validate file selection
     if not jpeg_files:
-        print("❌ No files selected. Operation cancelled.")
-        print("\n👋 Goodbye!")
+        logger.info("❌ No files selected. Operation cancelled.")
+        logger.info("\n👋 Goodbye!")
+        root.destroy()
         return
     
-    # Display selected files
-    print(f"✅ Selected {len(jpeg_files)} file(s):")
-    for i, file_path in enumerate(jpeg_files, 1):
-        file_size = os.path.getsize(file_path) / (1024*1024)  # Size in MB
-        print(f"  {i:2d}. {os.path.basename(file_path)} ({file_size:.1f} MB)")
+    # Look up the file sizes once, a stat call per file is slow on network drives
+    file_info = {file_path: os.stat(file_path) for file_path in jpeg_files}
+    
+    # Display selected files, as one log record rather than one per file
+    logger.info("\n".join([
+        f"✅ Selected {len(jpeg_files)} file(s):",
+        *(f"  {i:2d}. {os.path.basename(file_path)} ({stat.st_size / (1024*1024):.1f} MB)"
+          for i, (file_path, stat) in enumerate(file_info.items(), 1))
+    ]))
     
     # Step 2: Select output location
-    print(f"\n💾 Step 2: Choose output location for PDF...")
-    output_path = select_output_path()
+    logger.info(f"\n💾 Step 2: Choose output location for PDF...")
+    output_path = select_output_path(root)
     
     # Validate output path
     if not output_path:
-        print("❌ No output location selected. Operation cancelled.")
-        print("\n👋 Goodbye!")
+        logger.info("❌ No output location selected. Operation cancelled.")
+        logger.info("\n👋 Goodbye!")
+        root.destroy()
         return
     
-    print(f"✅ PDF will be saved as: {os.path.basename(output_path)}")
+    logger.info(f"✅ PDF will be saved as: {os.path.basename(output_path)}")
     
     # Step 3: Convert files to PDF
-    print(f"\n🔄 Step 3: Converting images to PDF...")
-    conversion_success = convert_jpegs_to_pdf(jpeg_files, output_path)
+    logger.info(f"\n🔄 Step 3: Converting images to PDF...")
+    conversion_success = convert_jpegs_to_pdf(jpeg_files, output_path, args.dpi)
     
     # Step 4: Display final result
     if conversion_success:
@@ -303,17 +994,16 @@ def main():
             f"📊 Size: {os.path.getsize(output_path) / (1024*1024):.1f} MB"
         )
         
-        root = tk.Tk()
-        root.withdraw()
-        messagebox.showinfo("✅ Conversion Complete", success_message)
-        root.destroy()
+        messagebox.showinfo("✅ Conversion Complete", success_message, parent=root)
         
-        print(f"\n🎉 Conversion completed successfully!")
+        logger.info(f"\n🎉 Conversion completed successfully!")
     else:
-        print(f"\n❌ Conversion failed. Please check the error messages above.")
+        logger.error(f"\n❌ Conversion failed. Please check the error messages above.")
+    
+    root.destroy()
     
-    print(f"\n👋 Thank you for using JPEG to PDF Converter!")
-    print("=" * 50)
+    logger.info(f"\n👋 Thank you for using JPEG to PDF Converter!")
+    logger.info("=" * 50)
 
 
 if __name__ == "__main__":